@@ -7,7 +7,9 @@ from .name import Name
 from .image_to_color import ImageToColor
 from .from_file import FromFile
 from .from_json import FromJson
+from .from_stack import FromStack
 from .exceptions import KMeansException
 
 __all__ = ['Resize', 'Back', 'Skin', 'Cluster', 'Selector', 'Name',
-           'ImageToColor', 'FromFile', 'FromJson', 'KMeansException']
+           'ImageToColor', 'FromFile', 'FromJson', 'FromStack',
+           'KMeansException']
@@ -17,7 +17,9 @@ class FromFile(Task):
         self._image_to_color = ImageToColor(samples, labels, self._settings)
 
     def get(self, uri):
-        i = imread(uri)
+        return self.get_array(imread(uri), splitext(basename(uri))[0])
+
+    def get_array(self, i, name):
         if len(i.shape) == 2:
             i = gray2rgb(i)
         else:
@@ -29,7 +31,7 @@ class FromFile(Task):
             return c
 
         c, imgs = c
-        b = splitext(basename(uri))[0]
+        b = name
         imsave(join(dbg, b + '-resized.jpg'), imgs['resized'])
         imsave(join(dbg, b + '-back.jpg'), img_as_float(imgs['back']))
         imsave(join(dbg, b + '-skin.jpg'), img_as_float(imgs['skin']))
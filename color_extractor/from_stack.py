@@ -0,0 +1,96 @@
+import sys
+
+import numpy as np
+
+from .from_file import FromFile
+from .task import Task
+
+
+class FromStack(Task):
+    """
+    Computes the colors of a stack of images stored in a single `.npy' file
+    or in a raw file of `uint8' pixels. The file is memory-mapped and each
+    image is handed to the pipeline as a view, meaning the whole stack is
+    never loaded in memory and several processes can share the same
+    page-cached file.
+    """
+    def __init__(self, samples, labels, settings=None):
+        """
+        The possible settings are:
+            - shape: The `(rows, columns)' of the images when reading a raw
+              file. Ignored for `.npy' files whose header holds the shape.
+              (default: None)
+
+            - debug: The directory where to write intermediate images, named
+              after the images' IDs.
+              (default: None)
+        """
+        if settings is None:
+            settings = {}
+
+        super(FromStack, self).__init__(settings)
+        self._from_file = FromFile(samples, labels, self._settings)
+
+    def get(self, uri, ids):
+        """
+        Returns an iterator over `(id, colors)' pairs, one for each image of
+        the stack found at `uri'. `ids' must hold exactly one ID per image.
+        The stack is opened and checked before this method returns.
+        """
+        stack = self._load(uri)
+        ids = list(ids)
+        if len(ids) != stack.shape[0]:
+            m = 'Got {} IDs for a stack of {} images.'
+            raise ValueError(m.format(len(ids), stack.shape[0]))
+
+        return self._iter(stack, ids)
+
+    def _iter(self, stack, ids):
+        for id_, img in zip(ids, stack):
+            try:
+                yield id_, self._from_file.get_array(img, str(id_))
+            except Exception as e:
+                m = 'Unable to find colors for {}: `{}`\n'.format(id_, e)
+                sys.stderr.write(m)
+                yield id_, []
+
+    def _load(self, uri):
+        if uri.endswith('.npy'):
+            stack = np.load(uri, mmap_mode='r')
+        else:
+            rows, cols = FromStack._check_shape(self._settings['shape'])
+            raw = np.memmap(uri, dtype=np.uint8, mode='r')
+            if raw.size % (rows * cols * 3) != 0:
+                m = 'Size of {} is not a multiple of {}x{}x3.'
+                raise ValueError(m.format(uri, rows, cols))
+            stack = raw.reshape(-1, rows, cols, 3)
+
+        if (stack.dtype != np.uint8 or len(stack.shape) not in (3, 4) or
+                (len(stack.shape) == 4 and stack.shape[-1] not in (3, 4))):
+            m = 'Expected a stack of uint8 images, got {} of shape {}.'
+            raise ValueError(m.format(stack.dtype, stack.shape))
+
+        return stack
+
+    @staticmethod
+    def _check_shape(shape):
+        if shape is None:
+            raise ValueError('A shape is needed to read raw stacks.')
+
+        m = 'Expected a shape of two positive integers, got {}.'
+        try:
+            ok = (len(shape) == 2 and
+                  all(isinstance(d, int) and d > 0 for d in shape))
+        except TypeError:
+            ok = False
+        if not ok:
+            raise ValueError(m.format(shape))
+
+        return shape
+
+    @staticmethod
+    def _default_settings():
+        return {
+            'shape': None,
+            'debug': None,
+        }